@@ -1,15 +1,32 @@
+import asyncio
+import functools
+import hashlib
+import io
+import itertools
+import multiprocessing
 import os
 import re
-from typing import List, Optional, Any, Dict
+from contextlib import asynccontextmanager
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import AsyncIterator, List, Optional, Any, Dict, Set, Tuple
 from urllib.parse import quote_plus
 
+import ahocorasick
+import anyio.to_thread
+from cachetools import LRUCache, TTLCache
 from fastapi import FastAPI, UploadFile, File, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, TypeAdapter
+from typing_extensions import TypedDict
 from dotenv import load_dotenv
-import pdfplumber
+import pypdfium2 as pdfium
 from docx import Document
-import requests
+import httpx
+import orjson
+from huggingface_hub import AsyncInferenceClient
 
 load_dotenv()
 
@@ -18,12 +35,46 @@ ADZUNA_APP_ID = os.getenv("ADZUNA_APP_ID")
 ADZUNA_APP_KEY = os.getenv("ADZUNA_APP_KEY")
 ADZUNA_COUNTRY = os.getenv("ADZUNA_COUNTRY", "gb")
 DEFAULT_JOB_LOCATION = os.getenv("DEFAULT_JOB_LOCATION", "Remote")
+THREADPOOL_SIZE = int(os.getenv("THREADPOOL_SIZE", "100"))
+
+HF_MODEL = "facebook/bart-large-mnli"  # مثال: ممكن تستخدم أي نموذج تعليمي
 
 # CORS configuration
 cors_origins_env = os.getenv("CORS_ORIGINS", "http://localhost:5173")
 ALLOW_ORIGINS = [origin.strip() for origin in cors_origins_env.split(",") if origin.strip()]
 
-app = FastAPI(title="SmartCV Job Finder API")
+
+def _new_parse_pool() -> ProcessPoolExecutor:
+    # workers are started lazily from a process with a running loop and threads,
+    # so avoid plain fork
+    method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    return ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=multiprocessing.get_context(method))
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # plain-text file reads run in the threadpool; allow more of them at once
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+    # PDF/DOCX parsing is CPU-bound and holds the GIL, so it gets its own processes
+    app.state.pool = _new_parse_pool()
+    # shared client so provider calls reuse connections and run concurrently
+    app.state.client = httpx.AsyncClient(
+        timeout=15,
+        follow_redirects=True,
+        headers={"User-Agent": "SmartCVJobFinder/1.0"},
+    )
+    # Hugging Face client only when a token is configured (else rule-based)
+    app.state.hf = AsyncInferenceClient(token=HF_TOKEN, timeout=20) if HF_TOKEN else None
+    try:
+        yield
+    finally:
+        await app.state.client.aclose()
+        if app.state.hf is not None:
+            await app.state.hf.close()
+        app.state.pool.shutdown()
+
+
+app = FastAPI(title="SmartCV Job Finder API", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -52,38 +103,68 @@ class FindJobsRequest(BaseModel):
     limit: int = 20
 
 
-class JobItem(BaseModel):
+class JobDict(TypedDict):
+    """A job kept as a plain dict on the /find_jobs path, so it is serialized
+    straight to NDJSON without building a model per job."""
     title: str
     company: str
     location: str
     description: str
     apply_link: str
-    source: Optional[str] = None
+    source: Optional[str]
 
 
-class FindJobsResponse(BaseModel):
-    jobs: List[JobItem]
+# providers collect plain dicts and validate the whole list in one call
+_JOB_DICTS = TypeAdapter(List[JobDict])
 
+# OpenAPI schema of each NDJSON line streamed by /find_jobs. Inlined because
+# FastAPI files a `responses` model under application/json for streaming routes.
+_FIND_JOBS_LINE_SCHEMA = {
+    "type": "object",
+    "properties": {"jobs": {"type": "array", "items": TypeAdapter(JobDict).json_schema()}},
+    "required": ["jobs"],
+}
 
-def extract_text_from_pdf(file: UploadFile) -> str:
-    try:
-        with pdfplumber.open(file.file) as pdf:
-            pages_text = [page.extract_text() or "" for page in pdf.pages]
-        text = "\n".join(pages_text)
-        return text.strip()
-    except Exception as exc:
-        raise HTTPException(status_code=400, detail=f"Failed to parse PDF: {exc}") from exc
+
+# Parsers run in app.state.pool, so they must be top-level and take plain bytes
+# (an UploadFile can't cross the process boundary).
+def _pdf_bytes_to_text(data: bytes) -> str:
+    with pdfium.PdfDocument(data) as pdf:
+        pages_text = [page.get_textpage().get_text_range() for page in pdf]
+    text = "\n".join(pages_text)
+    return text.strip()
 
 
-def extract_text_from_docx(file: UploadFile) -> str:
+def _docx_bytes_to_text(data: bytes) -> str:
+    document = Document(io.BytesIO(data))
+    paragraphs = [p.text for p in document.paragraphs]
+    text = "\n".join(paragraphs)
+    return text.strip()
+
+
+async def _parse_in_pool(parser, file: UploadFile, kind: str) -> str:
+    pool = app.state.pool
     try:
-        file.file.seek(0)
-        document = Document(file.file)
-        paragraphs = [p.text for p in document.paragraphs]
-        text = "\n".join(paragraphs)
-        return text.strip()
+        data = await file.read()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(pool, parser, data)
+    except BrokenProcessPool as exc:
+        # a worker crashed (e.g. a hostile file); replace the pool once so
+        # later uploads still work
+        if app.state.pool is pool:
+            app.state.pool = _new_parse_pool()
+            pool.shutdown(wait=False)
+        raise HTTPException(status_code=503, detail=f"{kind} parser crashed, please try again.") from exc
     except Exception as exc:
-        raise HTTPException(status_code=400, detail=f"Failed to parse DOCX: {exc}") from exc
+        raise HTTPException(status_code=400, detail=f"Failed to parse {kind}: {exc}") from exc
+
+
+async def extract_text_from_pdf(file: UploadFile) -> str:
+    return await _parse_in_pool(_pdf_bytes_to_text, file, "PDF")
+
+
+async def extract_text_from_docx(file: UploadFile) -> str:
+    return await _parse_in_pool(_docx_bytes_to_text, file, "DOCX")
 
 
 def extract_text_from_plain(file: UploadFile) -> str:
@@ -105,11 +186,11 @@ async def upload_cv(file: UploadFile = File(...)) -> Dict[str, Any]:
     lower_name = filename.lower()
 
     if lower_name.endswith(".pdf"):
-        text = extract_text_from_pdf(file)
+        text = await extract_text_from_pdf(file)
     elif lower_name.endswith(".docx"):
-        text = extract_text_from_docx(file)
+        text = await extract_text_from_docx(file)
     else:
-        text = extract_text_from_plain(file)
+        text = await run_in_threadpool(extract_text_from_plain, file)
 
     if not text:
         raise HTTPException(status_code=400, detail="No text could be extracted from the CV.")
@@ -137,19 +218,53 @@ COMMON_JOB_TITLES = [
     "product manager","project manager","ui/ux designer","qa engineer","cybersecurity analyst"
 ]
 
+# lowered once at import; the CV text is lowercased before matching
+_COMMON_SKILLS_L = tuple(s.lower() for s in COMMON_SKILLS)
+_COMMON_JOB_TITLES_L = tuple(t.lower() for t in COMMON_JOB_TITLES)
+
+# keyword -> recommended job type (order of JOB_TYPES is the output order)
+JOB_TYPES = ["remote", "part-time", "full-time"]
+JOB_TYPE_KEYWORDS = {
+    "remote": "remote", "work from home": "remote", "wfh": "remote",
+    "part-time": "part-time", "part time": "part-time",
+    "full-time": "full-time", "full time": "full-time",
+}
+
+
+def _build_cv_automaton() -> ahocorasick.Automaton:
+    """One automaton for every CV needle, so the text is scanned once."""
+    automaton = ahocorasick.Automaton()
+    for s in _COMMON_SKILLS_L:
+        automaton.add_word(s, ("skill", s))
+    for t in _COMMON_JOB_TITLES_L:
+        automaton.add_word(t, ("title", t))
+    for k, job_type in JOB_TYPE_KEYWORDS.items():
+        automaton.add_word(k, ("job_type", job_type))
+    automaton.make_automaton()
+    return automaton
+
+
+_CV_AUTOMATON = _build_cv_automaton()
+
+_YEARS_RE = re.compile(r"(\d{1,2})\s*\+?\s*(?:years|yrs)\b")
+_BR_RE = re.compile(r"<\s*br\s*/?>", re.I)
+_TAG_RE = re.compile(r"<[^>]+>")
+_NL_RE = re.compile(r"\n{3,}")
+
 def analyze_cv_rule_based(cv_text: str) -> AnalysisResult:
     """No-API fallback: extracts rough signals from the CV text."""
     text = (cv_text or "").lower()
 
-    # skills
-    skills = sorted({s for s in COMMON_SKILLS if s.lower() in text})
-
-    # job titles
-    job_titles = sorted({t for t in COMMON_JOB_TITLES if t.lower() in text})
+    # skills, job titles and job types in a single pass
+    found: Dict[str, set] = {"skill": set(), "title": set(), "job_type": set()}
+    for _, (kind, value) in _CV_AUTOMATON.iter(text):
+        found[kind].add(value)
+    skills = sorted(found["skill"])
+    job_titles = sorted(found["title"])
 
     # experience level heuristic
     years = []
-    for m in re.finditer(r"(\d{1,2})\s*\+?\s*(?:years|yrs)\b", text):
+    for m in _YEARS_RE.finditer(text):
         try:
             years.append(int(m.group(1)))
         except:
@@ -167,15 +282,10 @@ def analyze_cv_rule_based(cv_text: str) -> AnalysisResult:
     else:
         experience_level = "unknown"
 
-    recommended_job_types = []
-    if any(k in text for k in ["remote","work from home","wfh"]):
-        recommended_job_types.append("remote")
-    if any(k in text for k in ["part-time","part time"]):
-        recommended_job_types.append("part-time")
-    if any(k in text for k in ["full-time","full time"]):
-        recommended_job_types.append("full-time")
+    recommended_job_types = [t for t in JOB_TYPES if t in found["job_type"]]
 
-    summary = "Rule-based analysis (no API key). " + (cv_text.strip()[:220] + ("..." if len(cv_text.strip())>220 else ""))
+    stripped = cv_text.strip() if cv_text else ""
+    summary = "Rule-based analysis (no API key). " + (stripped[:220] + ("..." if len(stripped) > 220 else ""))
 
     return AnalysisResult(
         job_titles=job_titles,
@@ -185,14 +295,15 @@ def analyze_cv_rule_based(cv_text: str) -> AnalysisResult:
         summary=summary,
     )
 
-def call_hf_for_analysis(cv_text: str) -> AnalysisResult:
-    if not HF_TOKEN:
-        return analyze_cv_rule_based(cv_text)
+async def call_hf_for_analysis(cv_text: str) -> Tuple[AnalysisResult, bool]:
     """
     Use Hugging Face Inference API to analyze CV text and return structured data.
+    The flag is False when the call failed or its output wasn't JSON, so the
+    caller doesn't cache the blank fallback.
     """
-    HF_MODEL = "facebook/bart-large-mnli"  # مثال: ممكن تستخدم أي نموذج تعليمي
-    headers = {"Authorization": f"Bearer {HF_TOKEN}"}
+    hf = app.state.hf
+    if hf is None:
+        return analyze_cv_rule_based(cv_text), True
 
     prompt = (
         "Extract structured CV info in JSON format with keys: "
@@ -201,27 +312,19 @@ def call_hf_for_analysis(cv_text: str) -> AnalysisResult:
         f"CV TEXT: {cv_text}"
     )
 
-    payload = {"inputs": prompt}
-
     try:
-        response = requests.post(
-            f"https://api-inference.huggingface.co/models/{HF_MODEL}",
-            headers=headers,
-            json=payload,
-            timeout=20,
-        )
-        response.raise_for_status()
-        output = response.json()
         # نأخذ النص من النموذج
-        text_out = output[0]["generated_text"] if isinstance(output, list) else str(output)
+        text_out = await hf.text_generation(prompt, model=HF_MODEL, max_new_tokens=512)
     except Exception as exc:
         # لو فشل الاتصال أو الرد
         text_out = ""
 
-    import json
     try:
-        data = json.loads(text_out)
+        data = orjson.loads(text_out)
+        parsed = isinstance(data, dict)
     except Exception:
+        parsed = False
+    if not parsed:
         data = {}
 
     # رجعنا defaults لو النموذج ما عطى بيانات
@@ -244,17 +347,55 @@ def call_hf_for_analysis(cv_text: str) -> AnalysisResult:
         experience_level=str(experience_level).lower(),
         recommended_job_types=recommended_job_types,
         summary=summary,
-    )
+    ), parsed
+
+
+# blake2b(cv_text) -> AnalysisResult, so resubmitted CVs skip the scan / HF round-trip
+_ANALYSIS_CACHE: LRUCache = LRUCache(maxsize=1024)
 
 
 @app.post("/analyze", response_model=AnalysisResult)
 async def analyze(request: AnalyzeRequest) -> AnalysisResult:
-    if not request.cv_text or len(request.cv_text.strip()) < 50:
+    stripped = request.cv_text.strip() if request.cv_text else ""
+    if len(stripped) < 50:
         raise HTTPException(status_code=400, detail="CV text is too short. Please upload a more detailed CV.")
-    return call_hf_for_analysis(request.cv_text)
-
 
-def search_jobs_adzuna(keywords: str, location: Optional[str], limit: int = 20) -> List[JobItem]:
+    key = hashlib.blake2b(request.cv_text.encode("utf-8"), digest_size=16).digest()
+    cached = _ANALYSIS_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    result, cacheable = await call_hf_for_analysis(request.cv_text)
+    if cacheable:
+        _ANALYSIS_CACHE[key] = result
+    return result
+
+
+# (provider, search args, limit) -> jobs; short TTL keeps results fresh
+# while absorbing bursts of identical searches (and provider rate limits)
+_JOB_CACHE: TTLCache = TTLCache(maxsize=1024, ttl=300)
+
+
+def _cached_provider(fn):
+    """Serve repeated provider searches from _JOB_CACHE. Empty results are not
+    cached since providers return [] on network errors too."""
+    @functools.wraps(fn)
+    async def wrapper(client: httpx.AsyncClient, *args: Any) -> List[JobDict]:
+        key = (fn.__name__,) + args
+        cached = _JOB_CACHE.get(key)
+        if cached is not None:
+            return cached
+        results = await fn(client, *args)
+        if results:
+            _JOB_CACHE[key] = results
+        return results
+    return wrapper
+
+
+@_cached_provider
+async def search_jobs_adzuna(
+    client: httpx.AsyncClient, keywords: str, location: Optional[str], limit: int = 20
+) -> List[JobDict]:
     if not (ADZUNA_APP_ID and ADZUNA_APP_KEY):
         return []
 
@@ -269,24 +410,28 @@ def search_jobs_adzuna(keywords: str, location: Optional[str], limit: int = 20)
     }
 
     try:
-        response = requests.get(base_url, params=params, timeout=10)
+        response = await client.get(base_url, params=params, timeout=10)
         response.raise_for_status()
-        payload = response.json()
+        payload = orjson.loads(response.content)
     except Exception:
         return []
 
-    results = []
+    results: List[Dict[str, Any]] = []
+    fallback_loc = location or DEFAULT_JOB_LOCATION
     for item in payload.get("results", []):
-        results.append(JobItem(
+        desc = item.get("description") or ""
+        company = (item.get("company") or {}).get("display_name") or "Unknown Company"
+        loc = (item.get("location") or {}).get("display_name") or fallback_loc
+        results.append(dict(
             title=item.get("title") or "Unknown Role",
-            company=(item.get("company") or {}).get("display_name") or "Unknown Company",
-            location=(item.get("location") or {}).get("display_name") or location or DEFAULT_JOB_LOCATION,
-            description=item.get("description")[:400] if item.get("description") else "",
+            company=company,
+            location=loc,
+            description=desc[:400],
             apply_link=item.get("redirect_url") or "",
             source="Adzuna",
         ))
 
-    return results
+    return _JOB_DICTS.validate_python(results)
 
 
 def build_keywords_from_analysis(analysis: AnalysisResult) -> str:
@@ -299,17 +444,13 @@ def build_keywords_from_analysis(analysis: AnalysisResult) -> str:
     if analysis.recommended_job_types:
         parts += analysis.recommended_job_types[:2]
 
-    seen = set()
-    out: List[str] = []
+    # case-insensitive dedup; setdefault keeps the first spelling seen
+    unique: Dict[str, str] = {}
     for p in parts:
-        p = (p or "").strip()
-        if not p:
-            continue
-        k = p.lower()
-        if k in seen:
-            continue
-        seen.add(k)
-        out.append(p)
+        s = (p or "").strip()
+        if s:
+            unique.setdefault(s.lower(), s)
+    out = list(unique.values())
 
     return " ".join(out)[:120] or "software developer"
 
@@ -318,46 +459,51 @@ def _strip_html(s: str) -> str:
     if not s:
         return ""
     # very small sanitizer for API descriptions
-    s = re.sub(r"<\s*br\s*/?>", "\n", s, flags=re.I)
-    s = re.sub(r"<[^>]+>", "", s)
-    s = re.sub(r"\n{3,}", "\n\n", s)
+    s = _BR_RE.sub("\n", s)
+    s = _TAG_RE.sub("", s)
+    s = _NL_RE.sub("\n\n", s)
     return s.strip()
 
 
-def _keyword_match(keywords: str, hay: str) -> bool:
-    if not keywords:
+def _keyword_match(tokens: Tuple[str, ...], hay_l: str) -> bool:
+    """`hay_l` must already be lowercased (done once per job by the caller)."""
+    if not tokens:
         return True
-    hay_l = (hay or "").lower()
-    tokens = [t for t in re.split(r"\s+", keywords.lower()) if t]
     # accept if any token matches (avoid over-filtering)
     return any(t in hay_l for t in tokens)
 
 
-def _dedupe_jobs(jobs: List[JobItem], limit: int) -> List[JobItem]:
-    seen = set()
-    out: List[JobItem] = []
+def _dedupe_jobs(jobs: List[JobDict], limit: int, seen: Optional[Set[str]] = None) -> List[JobDict]:
+    """Pass the same `seen` set across calls to dedupe over several batches."""
+    if seen is None:
+        seen = set()
+    out: List[JobDict] = []
     for j in jobs:
-        key = (j.apply_link or "").strip().lower() or f"{j.title}|{j.company}".lower()
+        if len(out) >= limit:
+            break
+        link = (j["apply_link"] or "").strip()
+        key = link.lower() if link else f"{j['title']}|{j['company']}".lower()
         if key in seen:
             continue
         seen.add(key)
         out.append(j)
-        if len(out) >= limit:
-            break
     return out
 
 
-def search_jobs_remotive(keywords: str, limit: int = 20) -> List[JobItem]:
+@_cached_provider
+async def search_jobs_remotive(
+    client: httpx.AsyncClient, keywords: str, tokens: Tuple[str, ...], limit: int = 20
+) -> List[JobDict]:
     """Free API (no key). Must keep Remotive as source and link back to Remotive job URL."""
     url = f"https://remotive.com/api/remote-jobs?search={quote_plus(keywords)}&limit={min(limit, 50)}"
     try:
-        r = requests.get(url, timeout=15)
+        r = await client.get(url, timeout=15)
         r.raise_for_status()
-        payload = r.json()
+        payload = orjson.loads(r.content)
     except Exception:
         return []
 
-    results: List[JobItem] = []
+    results: List[Dict[str, Any]] = []
     for item in payload.get("jobs", []) or []:
         title = item.get("title") or "Unknown Role"
         company = item.get("company_name") or "Unknown Company"
@@ -366,10 +512,11 @@ def search_jobs_remotive(keywords: str, limit: int = 20) -> List[JobItem]:
         link = item.get("url") or ""
 
         # minimal relevance filter
-        if not _keyword_match(keywords, f"{title} {company} {desc} {loc}"):
+        hay_l = " ".join((title, company, desc, loc)).lower()
+        if not _keyword_match(tokens, hay_l):
             continue
 
-        results.append(JobItem(
+        results.append(dict(
             title=title,
             company=company,
             location=loc,
@@ -379,25 +526,27 @@ def search_jobs_remotive(keywords: str, limit: int = 20) -> List[JobItem]:
         ))
         if len(results) >= limit:
             break
-    return results
+    return _JOB_DICTS.validate_python(results)
 
 
-def search_jobs_remoteok(keywords: str, limit: int = 20) -> List[JobItem]:
+@_cached_provider
+async def search_jobs_remoteok(client: httpx.AsyncClient, tokens: Tuple[str, ...], limit: int = 20) -> List[JobDict]:
     """Free feed. Must keep Remote OK as source and link back to the Remote OK job URL."""
     for base in ["https://remoteok.com/api", "https://remoteok.io/api"]:
         try:
-            r = requests.get(base, timeout=20, headers={"User-Agent": "SmartCVJobFinder/1.0"})
+            r = await client.get(base, timeout=20)
             r.raise_for_status()
-            payload = r.json()
+            payload = orjson.loads(r.content)
             break
         except Exception:
             payload = None
     if not isinstance(payload, list):
         return []
 
-    results: List[JobItem] = []
-    # first element is usually metadata
-    for item in payload[1:]:
+    results: List[Dict[str, Any]] = []
+    # first element is usually metadata; islice skips it without copying the feed,
+    # and the loop stops reading once `limit` jobs are collected
+    for item in itertools.islice(payload, 1, None):
         if not isinstance(item, dict):
             continue
         title = item.get("position") or item.get("title") or "Unknown Role"
@@ -409,10 +558,11 @@ def search_jobs_remoteok(keywords: str, limit: int = 20) -> List[JobItem]:
         tags = item.get("tags") or []
         tag_str = " ".join(tags) if isinstance(tags, list) else str(tags)
 
-        if not _keyword_match(keywords, f"{title} {company} {loc} {tag_str} {desc}"):
+        hay_l = " ".join((title, company, loc, tag_str, desc)).lower()
+        if not _keyword_match(tokens, hay_l):
             continue
 
-        results.append(JobItem(
+        results.append(dict(
             title=title,
             company=company,
             location=loc,
@@ -422,16 +572,17 @@ def search_jobs_remoteok(keywords: str, limit: int = 20) -> List[JobItem]:
         ))
         if len(results) >= limit:
             break
-    return results
+    return _JOB_DICTS.validate_python(results)
 
 
-def search_jobs_arbeitnow(keywords: str, limit: int = 20) -> List[JobItem]:
+@_cached_provider
+async def search_jobs_arbeitnow(client: httpx.AsyncClient, tokens: Tuple[str, ...], limit: int = 20) -> List[JobDict]:
     """Free API (no key)."""
     url = "https://www.arbeitnow.com/api/job-board-api"
     try:
-        r = requests.get(url, timeout=20)
+        r = await client.get(url, timeout=20)
         r.raise_for_status()
-        payload = r.json()
+        payload = orjson.loads(r.content)
     except Exception:
         return []
 
@@ -439,7 +590,7 @@ def search_jobs_arbeitnow(keywords: str, limit: int = 20) -> List[JobItem]:
     if not isinstance(data, list):
         return []
 
-    results: List[JobItem] = []
+    results: List[Dict[str, Any]] = []
     for item in data:
         if not isinstance(item, dict):
             continue
@@ -452,10 +603,11 @@ def search_jobs_arbeitnow(keywords: str, limit: int = 20) -> List[JobItem]:
         tags = item.get("tags") or []
         tag_str = " ".join(tags) if isinstance(tags, list) else str(tags)
 
-        if not _keyword_match(keywords, f"{title} {company} {loc} {tag_str} {desc}"):
+        hay_l = " ".join((title, company, loc, tag_str, desc)).lower()
+        if not _keyword_match(tokens, hay_l):
             continue
 
-        results.append(JobItem(
+        results.append(dict(
             title=title,
             company=company,
             location=loc or DEFAULT_JOB_LOCATION,
@@ -465,14 +617,14 @@ def search_jobs_arbeitnow(keywords: str, limit: int = 20) -> List[JobItem]:
         ))
         if len(results) >= limit:
             break
-    return results
+    return _JOB_DICTS.validate_python(results)
 
 
-def mocked_jobs(analysis: AnalysisResult, location: str, limit: int) -> List[JobItem]:
+def mocked_jobs(analysis: AnalysisResult, location: str, limit: int) -> List[JobDict]:
     primary_title = (analysis.job_titles[0] if analysis.job_titles else None) or "Software Engineer"
     primary_type = (analysis.recommended_job_types[0] if analysis.recommended_job_types else None) or primary_title
     base_jobs = [
-        JobItem(
+        JobDict(
             title=f"{primary_title} ({analysis.experience_level.title()} Level)",
             company="SmartCV Labs",
             location=location,
@@ -480,7 +632,7 @@ def mocked_jobs(analysis: AnalysisResult, location: str, limit: int) -> List[Job
             apply_link="https://example.com/jobs/smartcv-labs",
             source="Mocked",
         ),
-        JobItem(
+        JobDict(
             title=f"{primary_type} - Remote Friendly",
             company="FutureWork Global",
             location=location,
@@ -492,30 +644,64 @@ def mocked_jobs(analysis: AnalysisResult, location: str, limit: int) -> List[Job
     return base_jobs[: max(1, min(limit, len(base_jobs)))]
 
 
-@app.post("/find_jobs", response_model=FindJobsResponse)
-async def find_jobs(request: FindJobsRequest) -> FindJobsResponse:
+def _ndjson_line(jobs: List[JobDict]) -> bytes:
+    return orjson.dumps({"jobs": jobs}) + b"\n"
+
+
+@app.post(
+    "/find_jobs",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"application/x-ndjson": {"schema": _FIND_JOBS_LINE_SCHEMA}}}},
+)
+async def find_jobs(request: FindJobsRequest) -> StreamingResponse:
+    """Streams NDJSON: one `{"jobs": [...]}` line per provider as it finishes,
+    so the client can render the fastest provider's jobs right away."""
     analysis = request.analysis
     location = request.location or DEFAULT_JOB_LOCATION
     limit = max(1, min(request.limit, 50))
 
     keywords = build_keywords_from_analysis(analysis)
-
-    # 1) Try real providers (free first, then Adzuna if configured)
-    collected: List[JobItem] = []
-
-    # Free providers (no keys)
-    collected += search_jobs_remotive(keywords, limit)
-    collected += search_jobs_remoteok(keywords, limit)
-    collected += search_jobs_arbeitnow(keywords, limit)
-
-    # Paid/Keyed provider (optional)
-    collected += search_jobs_adzuna(keywords, location, limit)
-
-    jobs = _dedupe_jobs(collected, limit)
-    if not jobs:
-        jobs = mocked_jobs(analysis, location, limit)
-
-    return FindJobsResponse(jobs=jobs)
+    # tokenized once and shared by every provider's relevance filter
+    tokens = tuple(keywords.lower().split())
+
+    async def _gen() -> AsyncIterator[bytes]:
+        # 1) Query real providers concurrently (free ones plus Adzuna if configured)
+        client = app.state.client
+        tasks = [
+            # Free providers (no keys)
+            asyncio.ensure_future(search_jobs_remotive(client, keywords, tokens, limit)),
+            asyncio.ensure_future(search_jobs_remoteok(client, tokens, limit)),
+            asyncio.ensure_future(search_jobs_arbeitnow(client, tokens, limit)),
+            # Paid/Keyed provider (optional)
+            asyncio.ensure_future(search_jobs_adzuna(client, keywords, location, limit)),
+        ]
+        seen: Set[str] = set()
+        sent = 0
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    result = await next_done
+                except Exception:
+                    continue
+                jobs = _dedupe_jobs(result, limit - sent, seen)
+                if not jobs:
+                    continue
+                sent += len(jobs)
+                yield _ndjson_line(jobs)
+                if sent >= limit:
+                    break
+        finally:
+            # limit reached or client went away: stop the remaining fetches
+            for task in tasks:
+                task.cancel()
+            # collect outcomes so failed/cancelled tasks aren't reported as unretrieved
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        # 2) Nothing found anywhere: fall back to mocked jobs
+        if not sent:
+            yield _ndjson_line(mocked_jobs(analysis, location, limit))
+
+    return StreamingResponse(_gen(), media_type="application/x-ndjson")
 
 
 @app.get("/")
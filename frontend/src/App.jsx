@@ -49,8 +49,10 @@ export default function App() {
       setStep(2);
 
       setStatusMessage("Searching matching jobs...");
-      const jobsResult = await findJobs(analysisResult, location, 20);
-      setJobs(jobsResult.jobs || []);
+      // jobs stream in per source; show each batch as soon as it arrives
+      await findJobs(analysisResult, location, 20, (batch) =>
+        setJobs((prev) => [...prev, ...batch])
+      );
       setStep(3);
       setStatusMessage("");
     } catch (err) {
@@ -247,7 +249,7 @@ export default function App() {
             </div>
 
             <div className="flex-1 rounded-xl border border-slate-800 bg-slate-950/40 overflow-hidden">
-              {isLoading && (
+              {isLoading && !hasJobs && (
                 <div className="flex flex-col items-center justify-center h-64 gap-3">
                   <span className="h-8 w-8 border-2 border-slate-300/70 border-t-transparent rounded-full animate-spin" />
                   <p className="text-xs text-slate-400">
@@ -268,7 +270,7 @@ export default function App() {
                 </div>
               )}
 
-              {!isLoading && hasJobs && (
+              {hasJobs && (
                 <div className="overflow-auto max-h-[480px]">
                   <table className="min-w-full text-left text-xs">
                     <thead className="sticky top-0 z-10 bg-slate-900/95 backdrop-blur border-b border-slate-800">
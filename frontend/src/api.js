@@ -35,7 +35,10 @@ export async function analyzeCvText(cvText) {
   return response.json();
 }
 
-export async function findJobs(analysis, location, limit = 20) {
+// /find_jobs streams NDJSON: one {"jobs": [...]} line per provider as it
+// finishes. onJobs (optional) is called with each batch; the full list is
+// returned once the stream ends.
+export async function findJobs(analysis, location, limit = 20, onJobs) {
   const response = await fetch(`${API_BASE_URL}/find_jobs`, {
     method: "POST",
     headers: {
@@ -53,5 +56,26 @@ export async function findJobs(analysis, location, limit = 20) {
     throw new Error(error.detail || "Failed to fetch jobs");
   }
 
-  return response.json();
+  const jobs = [];
+  const handleLine = (line) => {
+    if (!line.trim()) return;
+    const batch = JSON.parse(line).jobs || [];
+    jobs.push(...batch);
+    if (onJobs) onJobs(batch);
+  };
+
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = "";
+  for (;;) {
+    const { done, value } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+    const lines = buffer.split("\n");
+    buffer = lines.pop();
+    lines.forEach(handleLine);
+  }
+  handleLine(buffer + decoder.decode());
+
+  return { jobs };
 }